@@ -0,0 +1,248 @@
+#!/usr/bin/python
+"""Statistical benchmarks for the solutions and the nttools primitives.
+
+Every case is run WARMUP times untimed and then REPEAT times under
+time.perf_counter_ns; the report gives min, median and p95.  Primitives
+are run over a ladder of input sizes and a power law t ~ n^k is fitted
+to the medians.  With the solutions, the time of 'import solutions' in
+a fresh interpreter is checked against problems.IMPORT_BUDGET_MS.
+Results are written as JSON, and a previous JSON file can be given as a
+baseline to flag regressions.  A case that raises is recorded as
+{'error': ...} and skipped in the fits and comparisons; the run goes on
+and exits non-zero at the end.
+
+    python bench.py [-s] [-p] [-r REPEAT] [-w WARMUP] [-o OUT.json]
+                    [--baseline BASE.json] [--tolerance 0.1] [PATTERN ...]
+"""
+import argparse
+import fnmatch
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+import problems
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# a primitive benchmark: setup(n) builds the arguments outside the timing
+Case = namedtuple('Case', 'name func setup sizes')
+
+
+def _semiprime(n):
+    import nttools
+    p = next(nttools.primerange(math.isqrt(n)))
+    return (p * next(nttools.primerange(p + 1000)),)
+
+
+def _consume(it, n):
+    for i, _ in zip(range(n), it):
+        pass
+
+
+def primitives():
+    import fibonacci
+    import nttools
+    return [
+        Case('sieve', nttools.sieve, lambda n: (n,),
+             [10**5, 10**6, 10**7]),
+        Case('prime_blocks', lambda n: sum(len(b) for b in
+                                           nttools.prime_blocks(0, n)),
+             lambda n: (n,), [10**5, 10**6, 10**7]),
+        Case('gen_primes', lambda n: _consume(nttools.gen_primes(), n),
+             lambda n: (n,), [10**3, 10**4, 10**5]),
+        Case('prb', nttools.prb, _semiprime, [10**8, 10**12, 10**16]),
+        Case('pfactor', lambda n: (nttools.factorize.cache_clear(),
+                                   nttools.pfactor(n)),
+             _semiprime, [10**8, 10**12, 10**16]),
+        Case('prime_pi', nttools.prime_pi, lambda n: (n,),
+             [10**8, 10**9, 10**10]),
+        Case('prime_runs', nttools.prime_runs,
+             lambda n: ([n], nttools.sieve(n)), [10**6, 10**7, 10**8]),
+        Case('gen_fib', lambda n: _consume(nttools.gen_fib(), n),
+             lambda n: (n,), [10**3, 10**4, 10**5]),
+        Case('fib', fibonacci.fib, lambda n: (n,), [10**4, 10**5, 10**6]),
+        Case('sum_proper_divs', nttools.sum_proper_divs_array,
+             lambda n: (n,), [10**4, 10**5, 10**6]),
+    ]
+
+
+def solutions():
+    import solutions as pe
+    pe.stdoutON = False
+    return [(name, getattr(pe, name).__wrapped__) for name in problems.names()]
+
+
+def _stats(samples):
+    s = sorted(samples)
+    mid = len(s) // 2
+    median = s[mid] if len(s) % 2 else (s[mid - 1] + s[mid]) // 2
+    return {'min': s[0], 'median': median,
+            'p95': s[min(len(s) - 1, math.ceil(0.95 * len(s)) - 1)],
+            'samples': samples}
+
+
+def _timed(func, args):
+    t0 = time.perf_counter_ns()
+    func(*args)
+    return time.perf_counter_ns() - t0
+
+
+def measure(func, args=(), warmup=1, repeat=5):
+    """time func(*args): returns min, median, p95 (ns) and the samples"""
+    for _ in range(warmup):
+        func(*args)
+    return _stats([_timed(func, args) for _ in range(repeat)])
+
+
+def _measure_safely(func, setup=tuple, warmup=1, repeat=5):
+    """measure(func, setup()), or {'error': ...} if either raises, so one
+    broken case does not end the run"""
+    try:
+        return measure(func, setup(), warmup, repeat)
+    except Exception as e:
+        return {'error': '%s: %s' % (type(e).__name__, e)}
+
+
+def import_time(warmup=1, repeat=5):
+    """time 'import solutions' in a fresh interpreter, less the time of an
+    interpreter that imports nothing (run in pairs, one sample per pair)"""
+    bare = ([sys.executable, '-c', 'pass'],)
+    full = ([sys.executable, '-c', 'import solutions'],)
+    for _ in range(warmup):
+        subprocess.check_call(*full, cwd=HERE)
+    return _stats([max(_timed(subprocess.check_call, full)
+                       - _timed(subprocess.check_call, bare), 0)
+                   for _ in range(repeat)])
+
+
+def fit_exponent(sizes, times):
+    """least-squares slope k of log(t) against log(n), i.e. t ~ n^k"""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1)) for t in times]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+
+
+def compare(results, baseline, tolerance=0.1):
+    """(key, old median, new median) of every case slower than the
+    baseline by more than 'tolerance', whose fastest run is also slower
+    than the baseline median (so one noisy sample does not count)"""
+    regressions = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if 'error' in new or not old or 'error' in old:
+            continue
+        if new['median'] > old['median'] * (1 + tolerance) \
+                and new['min'] > old['median']:
+            regressions.append((key, old['median'], new['median']))
+    return regressions
+
+
+def _fmt(ns):
+    return '%10.3f ms' % (ns / 1e6)
+
+
+def _report(key, r):
+    if 'error' in r:
+        print('%-26s ERROR %s' % (key, r['error']))
+    else:
+        print('%-26s min %s  median %s  p95 %s' % (
+            key, _fmt(r['min']), _fmt(r['median']), _fmt(r['p95'])))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('patterns', nargs='*', metavar='PATTERN')
+    ap.add_argument('-s', '--solutions', action='store_true',
+                    help='benchmark the solutions')
+    ap.add_argument('-p', '--primitives', action='store_true',
+                    help='benchmark the nttools primitives')
+    ap.add_argument('-r', '--repeat', type=int, default=5)
+    ap.add_argument('-w', '--warmup', type=int, default=1)
+    ap.add_argument('-o', '--output', metavar='FILE', help='write JSON here')
+    ap.add_argument('--baseline', metavar='FILE',
+                    help='JSON from an earlier run to compare against')
+    ap.add_argument('--tolerance', type=float, default=0.1,
+                    help='allowed median slowdown (default 0.1 = 10%%)')
+    args = ap.parse_args(argv)
+    if not (args.solutions or args.primitives):
+        args.solutions = args.primitives = True
+
+    def wanted(name):
+        return not args.patterns or \
+            any(fnmatch.fnmatch(name, p) for p in args.patterns)
+
+    os.chdir(HERE)
+    sys.path.insert(0, HERE)
+    results, fits = {}, {}
+    over_budget = False
+    if args.primitives:
+        for case in primitives():
+            if not wanted(case.name):
+                continue
+            sizes, medians = [], []
+            for n in case.sizes:
+                key = '%s[%d]' % (case.name, n)
+                r = results[key] = _measure_safely(
+                    case.func, lambda: case.setup(n), args.warmup,
+                    args.repeat)
+                _report(key, r)
+                if 'error' not in r:
+                    sizes.append(n)
+                    medians.append(r['median'])
+            if len(sizes) >= 2:
+                fits[case.name] = fit_exponent(sizes, medians)
+                print('%-26s ~ n^%.2f' % (case.name, fits[case.name]))
+    if args.solutions and wanted('import'):
+        try:
+            r = import_time(args.warmup, args.repeat)
+        except Exception as e:
+            r = {'error': '%s: %s' % (type(e).__name__, e)}
+        results['import'] = r
+        _report('import solutions', r)
+        if 'error' not in r and \
+                r['median'] > problems.IMPORT_BUDGET_MS * 1e6:
+            print('OVER BUDGET: import takes more than %d ms'
+                  % problems.IMPORT_BUDGET_MS)
+            over_budget = True
+    if args.solutions:
+        for name, func in solutions():
+            if not wanted(name):
+                continue
+            r = results[name] = _measure_safely(func, tuple, args.warmup,
+                                                args.repeat)
+            _report(name, r)
+
+    report = {'python': platform.python_version(),
+              'machine': platform.platform(),
+              'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+              'repeat': args.repeat, 'warmup': args.warmup,
+              'results': results, 'fits': fits}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        for key, old, new in regressions:
+            print('REGRESSION %-26s %s -> %s (%+.0f%%)' % (
+                key, _fmt(old), _fmt(new), 100.0 * (new - old) / old))
+    else:
+        regressions = []
+    errors = [key for key, r in results.items() if 'error' in r]
+    if errors:
+        print('%d case(s) failed: %s' % (len(errors), ', '.join(errors)))
+    return 1 if regressions or over_budget or errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
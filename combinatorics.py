@@ -0,0 +1,107 @@
+"""Lexicographic ranking and unranking of permutations and combinations.
+
+The orders are those of itertools.permutations and
+itertools.combinations, i.e. by position in 'seq' (elements are
+assumed distinct for the rank functions), with ranks counted from 0:
+
+    perm_unrank(k, seq) == list(permutations(seq))[k]
+    comb_unrank(k, seq, r) == list(combinations(seq, r))[k]
+
+Permutations use the factorial number system: the first element is
+seq[k // (n-1)!] and so on down, O(n^2) for n elements.  Combinations
+count with binomials the same way.  Nothing scales with k, so the
+10^100-th permutation of 100 symbols is as quick as the first.
+"""
+import math
+
+
+def perm_unrank(k, seq):
+    """the k-th permutation of seq, as a tuple"""
+    seq = list(seq)
+    n = len(seq)
+    if not 0 <= k < math.factorial(n):
+        raise IndexError('permutation index %d out of range' % k)
+    out = []
+    for i in range(n - 1, -1, -1):
+        q, k = divmod(k, math.factorial(i))
+        out.append(seq.pop(q))
+    return tuple(out)
+
+
+def perm_rank(perm, seq=None):
+    """the index of the permutation 'perm' of seq (sorted(perm) if not
+    given)"""
+    seq = sorted(perm) if seq is None else list(seq)
+    if len(perm) != len(seq):
+        raise ValueError('not a permutation of seq')
+    pos = {x: i for i, x in enumerate(seq)}
+    left = list(range(len(seq)))  # positions not used yet, in order
+    k = 0
+    for i, x in enumerate(perm):
+        q = left.index(pos[x])
+        left.pop(q)
+        k += q * math.factorial(len(seq) - 1 - i)
+    return k
+
+
+def _next_perm(a):
+    """step the list a to its next permutation in place; False after
+    the last one"""
+    i = len(a) - 2
+    while i >= 0 and a[i] >= a[i + 1]:
+        i -= 1
+    if i < 0:
+        return False
+    j = len(a) - 1
+    while a[j] <= a[i]:
+        j -= 1
+    a[i], a[j] = a[j], a[i]
+    a[i + 1:] = reversed(a[i + 1:])
+    return True
+
+
+def perm_slice(seq, start=0, stop=None):
+    """generate the permutations start, start+1, ..., stop-1 of seq
+    lazily, like islice(permutations(seq), start, stop) without walking
+    the first 'start' ones"""
+    seq = list(seq)
+    total = math.factorial(len(seq))
+    stop = total if stop is None else min(stop, total)
+    if start >= stop:
+        return
+    idx = list(perm_unrank(start, range(len(seq))))
+    for _ in range(start, stop):
+        yield tuple(seq[i] for i in idx)
+        _next_perm(idx)
+
+
+def comb_unrank(k, seq, r):
+    """the k-th r-combination of seq, as a tuple"""
+    seq = list(seq)
+    n = len(seq)
+    if not 0 <= k < math.comb(n, r):
+        raise IndexError('combination index %d out of range' % k)
+    out, c = [], 0
+    for i in range(r):
+        # combinations whose next element is seq[c]
+        while k >= math.comb(n - c - 1, r - i - 1):
+            k -= math.comb(n - c - 1, r - i - 1)
+            c += 1
+        out.append(seq[c])
+        c += 1
+    return tuple(out)
+
+
+def comb_rank(comb, seq):
+    """the index of the combination 'comb' among the len(comb)-element
+    combinations of seq"""
+    pos = {x: i for i, x in enumerate(seq)}
+    n, r = len(pos), len(comb)
+    k, c = 0, 0
+    for i, x in enumerate(comb):
+        p = pos[x]
+        if p < c:
+            raise ValueError('not a combination of seq in order')
+        k += sum(math.comb(n - j - 1, r - i - 1) for j in range(c, p))
+        c = p + 1
+    return k
@@ -0,0 +1,104 @@
+"""Greatest product of k adjacent digits in a digit stream (p8).
+
+The digits are read in chunks (a buffer is sliced, a file is mapped and
+read slice by slice), anything that is not a digit is skipped, and the
+last k-1 digits are carried over to the next chunk, so a stream of any
+length is scanned in constant memory.
+
+Within a chunk every window is scored at once: a digit's product is
+2^a 3^b 5^c 7^d, so running sums of the exponents give every window's
+exponents exactly, and windows holding a 0 are masked out by a running
+count of zeros.  Windows are ranked by a log2 + b log3 + ... and the
+few that tie with the best up to rounding are settled with exact
+integer products.
+"""
+import mmap
+
+import numpy
+
+# exponents of 2, 3, 5, 7 in each digit (0 is handled separately)
+_EXPONENTS = numpy.array([[0, 0, 0, 0], [0, 0, 0, 0], [1, 0, 0, 0],
+                          [0, 1, 0, 0], [2, 0, 0, 0], [0, 0, 1, 0],
+                          [1, 1, 0, 0], [0, 0, 0, 1], [3, 0, 0, 0],
+                          [0, 2, 0, 0]], dtype=numpy.int64)
+_LOGS = numpy.log([2.0, 3.0, 5.0, 7.0])
+_CHUNK = 1 << 18
+
+
+def _digits(raw):
+    """the digits in the byte array 'raw', as uint8 values 0-9"""
+    raw = numpy.frombuffer(raw, dtype=numpy.uint8)
+    return raw[(raw >= 48) & (raw <= 57)] - 48
+
+
+def buffer_chunks(data, chunk=_CHUNK):
+    """generate the digits of the str or bytes-like 'data' in chunks"""
+    if isinstance(data, str):
+        data = data.encode('ascii')
+    data = memoryview(data).cast('B')
+    for i in range(0, len(data), chunk):
+        yield _digits(data[i:i + chunk])
+
+
+def file_chunks(fn, chunk=_CHUNK):
+    """generate the digits of the file 'fn' in chunks, read through mmap"""
+    with open(fn, 'rb') as f:
+        try:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with m:
+            for i in range(0, len(m), chunk):
+                yield _digits(m[i:i + chunk])
+
+
+def _product(exps):
+    return 2**int(exps[0]) * 3**int(exps[1]) * 5**int(exps[2]) \
+        * 7**int(exps[3])
+
+
+def max_product_chunks(chunks, k):
+    """(product, start) of the first window of k adjacent digits with the
+    greatest product, for digits given as a sequence of arrays; start
+    counts digits from 0.  None if there are fewer than k digits."""
+    if k < 1:
+        raise ValueError('window size must be positive')
+    best, carry, offset = None, numpy.zeros(0, dtype=numpy.uint8), 0
+    for digits in chunks:
+        d = numpy.concatenate((carry, digits))
+        nwin = len(d) - k + 1
+        if nwin > 0:
+            zeros = numpy.concatenate(([0], numpy.cumsum(d == 0)))
+            ok = numpy.flatnonzero(zeros[k:] == zeros[:-k])
+            if len(ok):
+                # exponents of 2, 3, 5, 7 in every zero-free window
+                win = numpy.empty((len(ok), 4), dtype=numpy.int64)
+                for j, column in enumerate(_EXPONENTS.T):
+                    c = numpy.concatenate(([0], numpy.cumsum(column[d])))
+                    win[:, j] = (c[k:] - c[:-k])[ok]
+                score = win @ _LOGS
+                top = score.max()
+                near = numpy.flatnonzero(score >= top - 1e-9 * max(top, 1.0))
+                # the exact products of the distinct near-best windows
+                for i in near[numpy.unique(win[near], axis=0,
+                                           return_index=True)[1]]:
+                    p = _product(win[i])
+                    if best is None or p > best[0] or \
+                            p == best[0] and offset + ok[i] < best[1]:
+                        best = (p, offset + int(ok[i]))
+            elif best is None:
+                best = (0, offset)
+        keep = min(k - 1, len(d))
+        offset += len(d) - keep
+        carry = d[len(d) - keep:]
+    return best
+
+
+def max_product(data, k, chunk=_CHUNK):
+    """max_product_chunks() over the digits of the str or bytes 'data'"""
+    return max_product_chunks(buffer_chunks(data, chunk), k)
+
+
+def max_product_file(fn, k, chunk=_CHUNK):
+    """max_product_chunks() over the digits of the file 'fn'"""
+    return max_product_chunks(file_chunks(fn, chunk), k)
@@ -0,0 +1,69 @@
+"""Fibonacci numbers by index, without walking the sequence (p2, p25).
+
+F(0) = 0, F(1) = 1.  fib() uses the fast-doubling identities
+
+    F(2k)   = F(k) * (2 F(k+1) - F(k))
+    F(2k+1) = F(k)^2 + F(k+1)^2
+
+so F(n) costs O(log n) big-number multiplications, or GMP's own fib
+when gmpy is installed.  Index searches start from Binet's formula,
+F(n) ~ phi^n / sqrt(5), and are settled by exact comparisons around
+the estimate, so the first term with a million digits needs only a
+couple of evaluations.
+"""
+import math
+
+try:
+    import gmpy
+except ImportError:
+    gmpy = None
+
+PHI = (1 + math.sqrt(5)) / 2
+
+
+def fib_pair(n):
+    """(F(n), F(n+1)) by fast doubling"""
+    if gmpy is not None:
+        return int(gmpy.fib(n)), int(gmpy.fib(n + 1))
+    a, b = 0, 1  # F(k), F(k+1) for k = the bits of n read so far
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b
+        if bit == '1':
+            a, b = b, a + b
+    return a, b
+
+
+def fib(n):
+    """F(n)"""
+    if gmpy is not None:
+        return int(gmpy.fib(n))
+    return fib_pair(n)[0]
+
+
+def index_below(limit):
+    """the largest n with F(n) < limit (-1 if limit <= 0)"""
+    if limit <= 1:
+        return 0 if limit == 1 else -1
+    n = max(int((math.log(limit) + math.log(5) / 2) / math.log(PHI)), 2)
+    a, b = fib_pair(n)
+    while a >= limit:
+        a, b, n = b - a, a, n - 1
+    while b < limit:
+        a, b, n = b, a + b, n + 1
+    return n
+
+
+def first_with_digits(D):
+    """the index of the first term with at least D decimal digits"""
+    if D <= 1:
+        return 0
+    return index_below(10 ** (D - 1)) + 1
+
+
+def even_sum(limit):
+    """the sum of the even terms below limit: they are F(3k), and
+    F(0) + F(3) + ... + F(3m) = (F(3m+2) - 1) / 2"""
+    if limit <= 0:
+        return 0
+    m = index_below(limit) // 3
+    return (fib(3 * m + 2) - 1) // 2
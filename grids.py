@@ -0,0 +1,70 @@
+"""Greatest product of k adjacent numbers in a grid (p11).
+
+Grids are loaded into a numpy array.  The windows in each direction
+(right, down, down-right, up-right) are a strided view of the grid
+itself, shape (rows, cols, k), so nothing is copied; the products are
+reduced over the last axis a band of rows at a time, which keeps the
+temporaries small even for a 10000 x 10000 grid.  Products that could
+pass int64 are taken over Python ints instead.
+"""
+from collections import namedtuple
+
+import numpy
+from numpy.lib.stride_tricks import as_strided
+
+DIRECTIONS = ('right', 'down', 'down-right', 'up-right')
+
+# the best window: its product, first cell and direction
+Window = namedtuple('Window', 'product row col direction')
+
+_BAND = 1 << 20  # entries per band of products
+
+
+def load_grid(source):
+    """the grid of whitespace-separated integers in 'source' (a file name,
+    an open file or a list of lines) as an int64 array"""
+    return numpy.loadtxt(source, dtype=numpy.int64, ndmin=2)
+
+
+def windows(grid, k, direction):
+    """read-only view of all k-windows of grid in 'direction', shape
+    (rows, cols, k); window [i, j] starts at grid cell (i, j) ('right',
+    'down', 'down-right') or (i + k - 1, j) ('up-right')"""
+    n, m = grid.shape
+    s0, s1 = grid.strides
+    shape, strides, base = {
+        'right': ((n, m - k + 1, k), (s0, s1, s1), grid),
+        'down': ((n - k + 1, m, k), (s0, s1, s0), grid),
+        'down-right': ((n - k + 1, m - k + 1, k), (s0, s1, s0 + s1), grid),
+        'up-right': ((n - k + 1, m - k + 1, k), (s0, s1, s1 - s0),
+                     grid[k - 1:]),
+    }[direction]
+    if min(shape) <= 0:
+        return numpy.zeros((0, 0, k), dtype=grid.dtype)
+    return as_strided(base, shape, strides, writeable=False)
+
+
+def max_product(grid, k=4):
+    """the Window with the greatest product of k adjacent numbers in a
+    line (across, down or diagonally) of grid; None if no line is k
+    long"""
+    grid = numpy.asarray(grid)
+    if k < 1:
+        raise ValueError('window size must be positive')
+    big = grid.size and int(numpy.abs(grid).max()) ** k >= 2**63
+    best = None
+    for direction in DIRECTIONS:
+        view = windows(grid, k, direction)
+        rows = max(1, _BAND // max(view.shape[1], 1))
+        for r0 in range(0, view.shape[0], rows):
+            band = view[r0:r0 + rows]
+            if big:
+                band = band.astype(object)
+            prods = band.prod(axis=-1)
+            if prods.size == 0:
+                continue
+            i, j = numpy.unravel_index(numpy.argmax(prods), prods.shape)
+            if best is None or prods[i, j] > best.product:
+                row = r0 + i + (k - 1 if direction == 'up-right' else 0)
+                best = Window(int(prods[i, j]), int(row), int(j), direction)
+    return best
@@ -2,9 +2,80 @@
 # -*- coding: utf-8 -*-
 import gmpy
 import random
-import fractions
+import contextlib
+import fcntl
+import functools
 import math
-from itertools import takewhile
+import os
+import numpy
+from collections import Counter, namedtuple
+from multiprocessing import Pool, shared_memory
+
+
+# Work counters for the hot paths (Pollard-Brent, the sieves, gen_primes
+# and the factorization cache).  They are off by default; when off, each
+# instrumented function pays one global test per call or per batch of
+# work, never per inner-loop step.  Worker processes of psieve count in
+# their own address space, so only serial work shows up here.
+
+_counters = None
+_cache_base = None
+
+
+def enable_counters():
+    """start counting (keeps any counts from before)"""
+    global _counters, _cache_base
+    if _counters is None:
+        _counters = Counter()
+        _cache_base = factorize.cache_info()
+
+
+def disable_counters():
+    global _counters
+    _counters = None
+
+
+def reset_counters():
+    global _cache_base
+    if _counters is not None:
+        _counters.clear()
+        _cache_base = factorize.cache_info()
+
+
+def counters():
+    """snapshot of the counts as a plain dict (empty when disabled)"""
+    if _counters is None:
+        return {}
+    info = factorize.cache_info()
+    snap = dict(_counters)
+    snap['factorize.cache_hits'] = info.hits - _cache_base.hits
+    snap['factorize.cache_misses'] = info.misses - _cache_base.misses
+    return dict(sorted(snap.items()))
+
+
+@contextlib.contextmanager
+def counting():
+    """count the work done in a with-block; yields a dict that is filled
+    on exit with the counts made inside it (counts of an enclosing
+    session are left alone)"""
+    was_on = _counters is not None
+    enable_counters()
+    before = counters()
+    snap = {}
+    try:
+        yield snap
+    finally:
+        for name, count in counters().items():
+            if name.endswith('_peak'):
+                # a maximum, not a sum: shown only if the block raised it
+                if count > before.get(name, 0):
+                    snap[name] = count
+                continue
+            count -= before.get(name, 0)
+            if count or name.startswith('factorize.'):
+                snap[name] = count
+        if not was_on:
+            disable_counters()
 
 
 def primes(pstart=1, N=None):
@@ -15,9 +86,8 @@ def primes(pstart=1, N=None):
     count = 0
     while breakcondition(count):
         prime = prime.next_prime()
-        if prime.is_prime():
-            count += 1
-            yield prime
+        count += 1
+        yield prime
 
 
 # Sieve of Eratosthenes
@@ -32,6 +102,7 @@ def gen_primes():
     # number being tested.
 
     D = {}
+    stats = _counters  # sampled once; see enable_counters()
 
     # The running integer that's checked for primeness
 
@@ -42,8 +113,13 @@ def gen_primes():
             # q is a new prime.
             # Yield it and mark its first multiple that isn't
             # already marked in previous iterations
+            if stats is not None:
+                stats['gen_primes.primes'] += 1
             yield q
             D[q * q] = [q]
+            if stats is not None:
+                if len(D) > stats['gen_primes.dict_peak']:
+                    stats['gen_primes.dict_peak'] = len(D)
         else:
             # q is composite. D[q] is the list of primes that
             # divide it. Since we've reached q, we no longer
@@ -52,34 +128,475 @@ def gen_primes():
             # numbers
             for p in D[q]:
                 D.setdefault(p + q, []).append(p)
+            if stats is not None:
+                stats['gen_primes.composites'] += 1
+                stats['gen_primes.witness_moves'] += len(D[q])
             del D[q]
 
         q += 1
 
 
 def sieveErat(N=10):
+    """list of the primes up to and including N; kept for the older
+    solutions, new code should call sieve() directly"""
+    return sieve(N + 1).primes.tolist()
 
-    # should probably be implemented as map to allow for quick removal
-    # of eliminated numbers rather than redundantly setting the
-    # booleans to False
 
-    def getnext(i, nums):
-        mx = len(nums)
-        if i >= mx:
-            return -1
-        while i < mx and not nums[i][1] or i == 0:
-            i += 1
-        return i
+# Bit-packed sieve on the 2*3*5 wheel.  Only the 8 residues mod 30 that
+# are coprime to 30 can be prime (beyond 2, 3 and 5), so each byte of the
+# bitmap covers 30 integers: bit j of byte b stands for 30*b + _WHEEL[j].
+# Sieving to 10^9 takes ~33MB for the bitmap, and the work is done in
+# segments so the temporaries stay cache-sized.
+
+_WHEEL = (1, 7, 11, 13, 17, 19, 23, 29)
+_WHEEL_ARR = numpy.array(_WHEEL, dtype=numpy.int64)
+# bitmask of each residue mod 30 (0 for residues sharing a factor with 30)
+_RESIDUE_MASK = numpy.zeros(30, dtype=numpy.uint8)
+_RESIDUE_MASK[list(_WHEEL)] = [1 << j for j in range(8)]
+_SEGMENT_BYTES = 1 << 17
+
+
+def _small_primes(n):
+    """primes below n with a plain numpy sieve (for base primes only)"""
+    s = numpy.ones(max(n, 2), dtype=bool)
+    s[:2] = False
+    for i in range(2, math.isqrt(max(n - 1, 1)) + 1):
+        if s[i]:
+            s[i*i::i] = False
+    return numpy.flatnonzero(s)
+
+
+def _wheel_offsets(base):
+    """per-prime constants for marking the multiples p*q, q on the wheel
+
+    For q = 30*t + w the multiple p*q lives in byte p*t + (p*w)//30, on
+    the bit of residue (p*w) % 30, so every (p, w) pair is a slice of
+    the bitmap with stride p.  Returns (P, C, TMIN, MASK): the primes,
+    the byte offsets for t = 0, the smallest t with q >= p, and the bit
+    to clear, the last three of shape (len(base), 8).
+    """
+    P = numpy.asarray(base, dtype=numpy.int64)
+    pw = P[:, None] * _WHEEL_ARR[None, :]
+    C = pw // 30
+    TMIN = numpy.maximum(0, -((_WHEEL_ARR[None, :] - P[:, None]) // 30))
+    MASK = ~_RESIDUE_MASK[pw % 30]
+    return P, C, TMIN, MASK
+
+
+def _wheel_segment(b0, b1, offsets):
+    """sieve bytes [b0, b1) of the wheel bitmap; 'offsets' come from
+    _wheel_offsets() of the primes 7 <= p <= sqrt(30*b1)"""
+    seg = numpy.full(b1 - b0, 0xff, dtype=numpy.uint8)
+    P, C, TMIN, MASK = offsets
+    keep = P * P < 30 * b1
+    P, C, TMIN, MASK = P[keep], C[keep], TMIN[keep], MASK[keep]
+    t0 = numpy.maximum(TMIN, -((C - b0) // P[:, None]))
+    start = P[:, None] * t0 + C - b0
+    n = b1 - b0
+    for p, starts, masks in zip(P.tolist(), start.tolist(), MASK.tolist()):
+        for s, m in zip(starts, masks):
+            if s < n:
+                seg[s::p] &= m
+    if b0 == 0:
+        seg[0] &= 0xfe  # 1 is not prime
+    if _counters is not None:
+        _counters['sieve.segments'] += 1
+        _counters['sieve.marks'] += int(numpy.maximum(
+            0, (n - start + P[:, None] - 1) // P[:, None]).sum())
+    return seg
+
+
+def _wheel_decode(seg, b0):
+    """the integers whose bits are set in 'seg' (bytes starting at b0)"""
+    idx = numpy.flatnonzero(numpy.unpackbits(seg, bitorder='little'))
+    return 30 * (b0 + (idx >> 3)) + _WHEEL_ARR[idx & 7]
+
+
+def _wheel_bits(b0, b1, segment=_SEGMENT_BYTES, out=None):
+    """sieve bytes [b0, b1) of the wheel bitmap, segment by segment"""
+    if out is None:
+        out = numpy.empty(b1 - b0, dtype=numpy.uint8)
+    offsets = _wheel_offsets(_small_primes(math.isqrt(30 * b1) + 1)[3:])
+    for s0 in range(b0, b1, segment):
+        s1 = min(s0 + segment, b1)
+        out[s0 - b0:s1 - b0] = _wheel_segment(s0, s1, offsets)
+    return out
+
+
+class PrimeTable(object):
+    """primality lookup table for the integers below N, backed by the
+    bit-packed wheel bitmap 'bits'"""
+
+    def __init__(self, bits, N):
+        self.bits = bits
+        self.N = N
+        self._primes = None
+
+    @property
+    def primes(self):
+        """all primes below N as a uint32 (or uint64) array"""
+        if self._primes is None:
+            dtype = numpy.uint32 if self.N <= 2**32 else numpy.uint64
+            chunks = [numpy.array([p for p in (2, 3, 5) if p < self.N],
+                                  dtype=dtype)]
+            # the bitmap may cover more than N (cached_sieve)
+            nbytes = min(len(self.bits), -(-self.N // 30))
+            for b0 in range(0, nbytes, _SEGMENT_BYTES):
+                ps = _wheel_decode(
+                    self.bits[b0:min(b0 + _SEGMENT_BYTES, nbytes)], b0)
+                chunks.append(ps[ps < self.N].astype(dtype))
+            self._primes = numpy.concatenate(chunks)
+        return self._primes
+
+    def __len__(self):
+        return len(self.primes)
+
+    def __contains__(self, n):
+        return bool(self.is_prime(n))
+
+    def is_prime(self, n):
+        """primality of n (an int or an integer array), 0 <= n < N"""
+        a = numpy.asarray(n, dtype=numpy.int64)
+        if a.size and (a.min() < 0 or a.max() >= self.N):
+            raise ValueError('%s outside the sieved range [0, %d)'
+                             % (n, self.N))
+        mask = _RESIDUE_MASK[a % 30]
+        res = (self.bits[a // 30] & mask) != 0
+        res |= (a == 2) | (a == 3) | (a == 5)
+        return bool(res) if res.ndim == 0 else res
+
+
+def sieve(N, segment=_SEGMENT_BYTES):
+    """sieve the integers below N; returns a PrimeTable"""
+    nbytes = max(-(-N // 30), 1)
+    return PrimeTable(_wheel_bits(0, nbytes, segment), N)
+
+
+def _segments(lo, hi, step, scale=1):
+    """generate (a, b, base) for the consecutive segments [a, b) of at
+    most 'step' units covering [lo, hi), a unit being 'scale' integers;
+    hi=None keeps going forever.  base holds the primes up to at least
+    sqrt(scale*b); it is the same array until it has to be extended."""
+    a, plim, base = lo, 0, None
+    while hi is None or a < hi:
+        b = a + step if hi is None else min(a + step, hi)
+        if scale * b > plim * plim:
+            # unbounded: overshoot so the base primes are rebuilt rarely
+            plim = math.isqrt(scale * b) * (1 if hi is not None else 4) + 1
+            base = _small_primes(plim + 1)
+        yield a, b, base
+        a = b
+
+
+def prime_blocks(lo=0, hi=None, segment=_SEGMENT_BYTES):
+    """generate the primes in [lo, hi) as int64 arrays, one per sieve
+    segment (30*segment integers); hi=None keeps going forever.  Only
+    the base primes up to sqrt(hi) and one segment are held in memory.
+    """
+    yield numpy.array([p for p in (2, 3, 5)
+                       if lo <= p and (hi is None or p < hi)],
+                      dtype=numpy.int64)
+    bend = None if hi is None else -(-hi // 30)
+    base, offsets = None, None
+    for b, b1, bp in _segments(lo // 30, bend, segment, 30):
+        if bp is not base:
+            base, offsets = bp, _wheel_offsets(bp[3:])
+        ps = _wheel_decode(_wheel_segment(b, b1, offsets), b)
+        if b * 30 < lo:
+            ps = ps[ps >= lo]
+        if hi is not None and b1 * 30 > hi:
+            ps = ps[ps < hi]
+        yield ps
+
+
+def primerange(lo=0, hi=None, segment=_SEGMENT_BYTES):
+    """generate the primes in [lo, hi) one int at a time"""
+    for block in prime_blocks(lo, hi, segment):
+        for p in block.tolist():
+            yield p
+
+
+# On-disk prime table cache.  The wheel bitmap is stored as a .npy file
+# and loaded with mmap_mode='r', so every process shares the same page
+# cache pages and nothing is copied; asking for a larger bound sieves
+# only the missing tail.  Bump CACHE_VERSION if the bitmap layout changes.
+
+CACHE_VERSION = 1
+CACHE_DIR = os.environ.get(
+    'PE_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'project-euler'))
+
+
+def _load_bits(path):
+    try:
+        bits = numpy.load(path, mmap_mode='r')
+    except (IOError, ValueError):
+        return None
+    if bits.dtype != numpy.uint8 or bits.ndim != 1:
+        return None
+    return bits
+
+
+def cached_sieve(N, cache_dir=None):
+    """like sieve(N), but backed by the memory-mapped bitmap cached in
+    cache_dir (CACHE_DIR by default), which is grown if too small"""
+    cache_dir = cache_dir or CACHE_DIR
+    path = os.path.join(cache_dir, 'wheel30-v%d.npy' % CACHE_VERSION)
+    nbytes = max(-(-N // 30), 1)
+    bits = _load_bits(path)
+    if bits is None or len(bits) < nbytes:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path + '.lock', 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            # another process may have grown it while we waited
+            bits = _load_bits(path)
+            have = 0 if bits is None else len(bits)
+            if have < nbytes:
+                size = -(-nbytes // _SEGMENT_BYTES) * _SEGMENT_BYTES
+                tmp = '%s.%d.tmp' % (path, os.getpid())
+                grown = numpy.lib.format.open_memmap(
+                    tmp, mode='w+', dtype=numpy.uint8, shape=(size,))
+                if have:
+                    grown[:have] = bits
+                _wheel_bits(have, size, out=grown[have:])
+                grown.flush()
+                del grown
+                os.replace(tmp, path)
+                bits = _load_bits(path)
+    return PrimeTable(bits, N)
+
+
+# Multi-process segmented sieve.  The base primes are put in one shared
+# memory block that every worker maps read-only; each task sieves a run
+# of whole segments and sends back only its aggregates (and its bitmap,
+# if asked for).
+
+SieveChunk = namedtuple('SieveChunk', 'lo hi count sum last bits')
+
+_psieve_state = {}
+
+
+def _psieve_init(shm_name, nbase):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    base = numpy.ndarray((nbase,), dtype=numpy.int64, buffer=shm.buf)
+    _psieve_state['shm'] = shm  # keep the mapping alive
+    _psieve_state['offsets'] = _wheel_offsets(base)
+
+
+def _psieve_task(args):
+    lo, hi, segment, bitmap = args
+    offsets = _psieve_state['offsets']
+    count, total, last, bits = 0, 0, None, []
+    b1 = -(-hi // 30)
+    for s0 in range(lo // 30, b1, segment):
+        seg = _wheel_segment(s0, min(s0 + segment, b1), offsets)
+        ps = _wheel_decode(seg, s0)
+        ps = ps[(ps >= lo) & (ps < hi)]
+        if len(ps):
+            count += len(ps)
+            total += int(ps.sum())
+            last = int(ps[-1])
+        if bitmap:
+            bits.append(seg)
+    return SieveChunk(lo, hi, count, total, last,
+                      numpy.concatenate(bits) if bitmap else None)
+
+
+def psieve(lo, hi, processes=None, segment=_SEGMENT_BYTES, bitmap=False):
+    """sieve [lo, hi) on a process pool; returns the list of SieveChunks
+    (lo, hi, count, sum, last prime, wheel bitmap or None) in order.
+    Chunks start on segment boundaries, so their bitmaps concatenate
+    into the bitmap of the whole range."""
+    processes = processes or os.cpu_count()
+    span = 30 * segment
+    nseg = -(-hi // span) - lo // span
+    per = max(1, -(-nseg // (4 * processes)))
+    cuts = [max(lo, (lo // span + i) * span) for i in range(0, nseg, per)]
+    tasks = [(a, b, segment, bitmap) for a, b in zip(cuts, cuts[1:] + [hi])]
+    base = _small_primes(math.isqrt(hi) + 1)[3:]
+    shm = shared_memory.SharedMemory(create=True, size=max(base.nbytes, 8))
+    try:
+        numpy.ndarray(base.shape, dtype=numpy.int64, buffer=shm.buf)[:] = base
+        with Pool(processes, _psieve_init, (shm.name, len(base))) as pool:
+            chunks = pool.map(_psieve_task, tasks, chunksize=1)
+    finally:
+        shm.close()
+        shm.unlink()
+    # 2, 3 and 5 are off the wheel
+    small = [p for p in (2, 3, 5) if lo <= p < hi]
+    if small and chunks:
+        c = chunks[0]
+        chunks[0] = c._replace(count=c.count + len(small),
+                               sum=c.sum + sum(small),
+                               last=c.last if c.last else small[-1])
+    return chunks
+
+
+def pcount_primes(N, processes=None):
+    """number of primes below N, sieved in parallel"""
+    return sum(c.count for c in psieve(0, N, processes))
+
+
+def psum_primes(N, processes=None):
+    """sum of the primes below N, sieved in parallel"""
+    return sum(c.sum for c in psieve(0, N, processes))
+
+
+def pnth_prime(n, processes=None):
+    """the nth prime (pnth_prime(1) == 2), sieved in parallel"""
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+    # Rosser's bound: p_n < n (ln n + ln ln n) for n >= 6
+    bound = int(n * (math.log(n) + math.log(math.log(n)))) + 1
+    seen = 0
+    for c in psieve(0, bound, processes):
+        if seen + c.count >= n:
+            block = numpy.concatenate(list(prime_blocks(c.lo, c.hi)))
+            return int(block[n - 1 - seen])
+        seen += c.count
+
+
+# Prime counting without a full sieve (Lucy_Hedgehog's method).  S(v) is
+# the count (or sum) of the integers 2..v not yet crossed off; only the
+# values v = x//i are ever needed, at most 2*sqrt(x) of them, held as
+# small[v] for v <= sqrt(x) and large[i] = S(x//i).  Crossing off the
+# multiples of p does S(v) -= w(p) * (S(v//p) - S(p-1)) for v >= p*p,
+# a few strided array operations per base prime: O(x^(3/4)) time and
+# O(sqrt(x)) memory.  Sums of primes outgrow int64 beyond x ~ 4e9, so
+# they are run twice, exactly modulo 2^64 in uint64 and approximately in
+# float64; the float result fixes the multiple of 2^64.
+
+
+def _lucy(x, tables, weighted):
+    """sieve the (small, large) table pairs in place, see above"""
+    r = math.isqrt(x)
+    for p in _small_primes(r + 1).tolist():
+        p2 = p * p
+        imax = min(r, x // p2)
+        k = min(imax, r // p)  # large[i*p] is in the table for i <= k
+        rest = x // (numpy.arange(k + 1, imax + 1, dtype=numpy.int64) * p)
+        v = numpy.arange(p2, r + 1, dtype=numpy.int64) // p
+        for small, large in tables:
+            sp = small[p - 1]
+            w = small.dtype.type(p if weighted else 1)
+            large[1:k + 1] -= w * (large[p:k * p + 1:p] - sp)
+            large[k + 1:imax + 1] -= w * (small[rest] - sp)
+            small[p2:] -= w * (small[v] - sp)
 
-    nums = [list(t) for t in zip(range(2, N + 1), (N - 1) * [True])]
-    mx = len(nums)
-    i = 0
-    while i >= 0 and i < mx:
-        v = nums[i][0]
-        for j in range(i + v, N - 1, v):
-            nums[j][1] = False
-        i = getnext(i + 1, nums)
-    return [n[0] for n in nums if n[1]]
+
+def _lucy_values(x):
+    r = math.isqrt(x)
+    i = numpy.arange(1, r + 1, dtype=numpy.int64)
+    return (numpy.arange(r + 1, dtype=numpy.int64),
+            numpy.concatenate(([0], x // i)))
+
+
+def prime_pi(x):
+    """pi(x), the number of primes <= x, in O(x^(3/4)) time and
+    O(sqrt(x)) memory (x up to ~10^13)"""
+    if x < 2:
+        return 0
+    small, large = _lucy_values(x)
+    small, large = numpy.maximum(small - 1, 0), large - 1
+    _lucy(x, [(small, large)], False)
+    return int(large[1])
+
+
+def prime_sum(x):
+    """the sum of the primes <= x, in O(x^(3/4)) time and O(sqrt(x))
+    memory"""
+    if x < 2:
+        return 0
+    tables = []
+    for v in _lucy_values(x):
+        u = v.astype(numpy.uint64)
+        # v(v+1)/2 - 1, halving the even factor before it can wrap
+        u = numpy.where(u % 2 == 0, u // 2 * (u + 1), (u + 1) // 2 * u) - 1
+        f = v.astype(numpy.float64)
+        tables.append((u, f * (f + 1) / 2 - 1))
+    (us, fs), (ul, fl) = tables
+    _lucy(x, [(us, ul), (fs, fl)], True)
+    exact = int(ul[1])
+    return exact + round((float(fl[1]) - exact) / 2.0**64) * 2**64
+
+
+def nth_prime(n):
+    """the nth prime (nth_prime(1) == 2): prime_pi() brackets it from
+    below, and a segmented sieve counts the rest of the way"""
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+    ln, lnln = math.log(n), math.log(math.log(n))
+    x = int(n * (ln + lnln - 1 + (lnln - 2) / ln))
+    while True:
+        seen = prime_pi(x)
+        gap = (n - seen) * math.log(x)  # roughly how far the nth prime is
+        if 0 < n - seen and gap < 30 * _SEGMENT_BYTES * 8:
+            break
+        # aim a little below it, the error of pi(x) ~ x/ln(x) and more
+        x = max(2, int(x + gap) - math.isqrt(x))
+    for block in prime_blocks(x + 1):
+        if seen + len(block) >= n:
+            return int(block[n - 1 - seen])
+        seen += len(block)
+
+
+# Runs of consecutive primes with a prime sum (p50).  The run of k primes
+# starting with the ith is P[i+k] - P[i] for the prefix sums P, and these
+# grow with i, so the runs below N are a prefix of P[k:] - P[:-k].  The
+# lengths are tried from the longest down; a run of k primes below N
+# starts below N/k, so the primes are only extended as far as that.
+# Runs of even length are odd sums only when they start with 2.
+
+PrimeRun = namedtuple('PrimeRun', 'length total start')
+
+
+def prime_runs(limits, table=None):
+    """for every N in 'limits', the PrimeRun (length, total, start) of the
+    longest run of consecutive primes whose sum is a prime below N (the
+    one with the smallest sum if there are several), starting with the
+    start-th prime (0 for 2); None for N <= 2.  All limits are answered
+    in one pass.  'table' is a PrimeTable for the integers below
+    max(limits), sieved here if not given."""
+    limits = [int(N) for N in limits]
+    Nmax = max(limits, default=0)
+    if table is None:
+        table = sieve(Nmax)
+    elif table.N < Nmax:
+        raise ValueError('the table covers only the integers below %d'
+                         % table.N)
+    pending = sorted(set(N for N in limits if N > 2))
+    answers = {}
+    ps, prefix, hi = numpy.zeros(0, dtype=numpy.int64), None, 0
+
+    def extend(x):
+        nonlocal ps, prefix, hi
+        ps = numpy.concatenate([ps] + list(prime_blocks(hi, x)))
+        prefix = numpy.concatenate(([0], numpy.cumsum(ps)))
+        hi = x
+
+    extend(1024)
+    while pending and prefix[-1] < pending[-1]:
+        extend(2 * hi)
+    k = int(numpy.searchsorted(prefix, pending[-1])) - 1 if pending else 0
+    while pending:
+        L = pending[-1]
+        k = min(k, int(numpy.searchsorted(prefix, L)) - 1)
+        first = L // k + 1  # every run below L starts below this
+        while hi < first or \
+                len(ps) < numpy.searchsorted(ps, first) + k:
+            extend(max(2 * hi, first))
+        starts = min(int(numpy.searchsorted(ps, first)), len(ps) - k + 1)
+        if k % 2 == 0:
+            starts = min(starts, 1)
+        s = prefix[k:k + starts] - prefix[:starts]
+        s = s[:numpy.searchsorted(s, L)]
+        hits = numpy.flatnonzero(table.is_prime(s)) if len(s) else ()
+        if len(hits):
+            run = PrimeRun(k, int(s[hits[0]]), int(hits[0]))
+            while pending and pending[-1] > run.total:
+                answers[pending.pop()] = run
+        k -= 1
+    return [answers.get(N) for N in limits]
 
 
 def factor(N):
@@ -95,6 +612,147 @@ def factor(N):
     return [1, N] + factors
 
 
+def spf_sieve(N):
+    """smallest prime factor of every n < N as an array (0 for 0 and 1)"""
+    dtype = numpy.uint32 if N <= 2**32 else numpy.uint64
+    spf = numpy.zeros(max(N, 2), dtype=dtype)
+    # largest primes first, so the smallest factor is written last
+    for p in reversed(_small_primes(math.isqrt(max(N - 1, 1)) + 1).tolist()):
+        spf[p*p::p] = p
+    primes = numpy.flatnonzero(spf[2:] == 0) + 2
+    spf[primes] = primes
+    return spf[:N]
+
+
+def factor_many(r, spf=None):
+    """prime factors (with multiplicity, ascending) of every integer in
+    the range 'r', which must be positive; 'spf' may be a precomputed
+    spf_sieve() covering max(r).  Every round divides all the numbers by
+    their smallest prime factor at once, so the cost is one array pass
+    per prime factor of the most composite number in the range."""
+    n = numpy.arange(r.start, r.stop, r.step, dtype=numpy.int64)
+    if not len(n):
+        return []
+    if spf is None:
+        spf = spf_sieve(int(n.max()) + 1)
+    cols = []
+    while True:
+        p = spf[n].astype(numpy.int64)  # spf[1] == 0 marks a finished n
+        if not p.any():
+            break
+        cols.append(p)
+        n //= numpy.maximum(p, 1)
+    if not cols:
+        return [[] for _ in range(len(n))]
+    F = numpy.stack(cols, axis=1)
+    ends = numpy.cumsum(numpy.count_nonzero(F, axis=1)).tolist()
+    flat = F[F != 0].tolist()  # row-major, so each row stays ascending
+    return [flat[a:b] for a, b in zip([0] + ends, ends)]
+
+
+# Multiplicative functions for every n < N.  Each chunk of the number
+# line is sieved by the primes up to sqrt(N): the multiples of p form one
+# strided slice, p is divided out of the slice as often as it goes, and
+# the p-part of every function is multiplied in.  What is left above 1
+# afterwards is a single prime factor > sqrt(N).
+
+MULTIPLICATIVE = ('d', 'sigma', 's', 'phi', 'omega')
+
+
+def multiplicative_sieve(N, which=MULTIPLICATIVE, chunk=1 << 20):
+    """tables of the divisor count d(n), divisor sum sigma(n), aliquot
+    sum s(n) = sigma(n) - n, totient phi(n) and number of distinct prime
+    factors omega(n) for 0 <= n < N (all 0 at n = 0); returns a dict of
+    arrays holding just the functions named in 'which'"""
+    small = N <= 2**32
+    dtypes = {'d': numpy.uint32, 'sigma': numpy.int64, 's': numpy.int64,
+              'phi': numpy.uint32 if small else numpy.int64,
+              'omega': numpy.uint8}
+    out = {f: numpy.zeros(N, dtype=dtypes[f]) for f in which}
+    need_sigma = 'sigma' in which or 's' in which
+    base = _small_primes(math.isqrt(max(N - 1, 1)) + 1).tolist()
+    for lo in range(1, N, chunk):
+        hi = min(lo + chunk, N)
+        rest = numpy.arange(lo, hi, dtype=numpy.int64)
+        d = numpy.ones(hi - lo, dtype=numpy.int64)
+        sigma = numpy.ones(hi - lo, dtype=numpy.int64)
+        phi = numpy.ones(hi - lo, dtype=numpy.int64)
+        omega = numpy.zeros(hi - lo, dtype=numpy.uint8)
+        for p in base:
+            if p * p >= hi:
+                break
+            sl = slice((-lo) % p, None, p)
+            sub = rest[sl]
+            e = numpy.zeros(len(sub), dtype=numpy.int64)
+            pk = numpy.ones(len(sub), dtype=numpy.int64)  # p^e
+            div = numpy.ones(len(sub), dtype=bool)
+            while div.any():
+                sub[div] //= p
+                e[div] += 1
+                pk[div] *= p
+                div = sub % p == 0
+            rest[sl] = sub
+            d[sl] *= e + 1
+            if need_sigma:
+                sigma[sl] *= (pk * p - 1) // (p - 1)
+            phi[sl] *= pk // p * (p - 1)
+            omega[sl] += 1
+        big = rest > 1
+        q = rest[big]
+        d[big] *= 2
+        sigma[big] *= q + 1
+        phi[big] *= q - 1
+        omega[big] += 1
+        tables = {'d': d, 'sigma': sigma, 'phi': phi, 'omega': omega}
+        if 's' in which:
+            tables['s'] = sigma - numpy.arange(lo, hi, dtype=numpy.int64)
+        for f in which:
+            out[f][lo:hi] = tables[f]
+    return out
+
+
+def omega_blocks(lo=0, hi=None, segment=1 << 20):
+    """generate omega(n), the number of distinct prime factors (0 for n
+    = 0, 1), for n in [lo, hi) as uint8 arrays of 'segment' integers (the
+    last may be shorter), streamed like prime_blocks()"""
+    bp, base = None, None
+    for a, b, new in _segments(lo, hi, segment):
+        if new is not bp:
+            bp, base = new, new.tolist()
+        rest = numpy.arange(a, b, dtype=numpy.int64)
+        omega = numpy.zeros(b - a, dtype=numpy.uint8)
+        for p in base:
+            if p * p >= b:
+                break
+            omega[(-a) % p::p] += 1
+            pk = p
+            while pk < b:
+                rest[(-a) % pk::pk] //= p
+                pk *= p
+        # what is left is 1 or a single prime above sqrt(b)
+        omega[rest > 1] += 1
+        if a == 0:
+            omega[0] = 0
+        yield omega
+
+
+def omega_streak(m, k, lo=2, hi=None, segment=1 << 20):
+    """the first n >= lo such that the k integers n, ..., n+k-1 (all
+    below hi) each have exactly m distinct prime factors, or None.
+    Scans omega_blocks() and stops at the first hit."""
+    start = a = lo  # start: where the current run of hits began
+    for omega in omega_blocks(lo, hi, segment):
+        idx = numpy.arange(a, a + len(omega), dtype=numpy.int64)
+        starts = numpy.maximum.accumulate(
+            numpy.where(omega != m, idx + 1, start))
+        done = numpy.flatnonzero(idx - starts + 1 >= k)
+        if len(done):
+            return int(starts[done[0]])
+        start = int(starts[-1])
+        a += len(omega)
+    return None
+
+
 def pfactorGen(N):
     """generate prime factors of the number N"""
 
@@ -102,16 +760,17 @@ def pfactorGen(N):
     if n == 2:
         yield 2
     else:
-        p = list(takewhile(lambda x: x < N, primes(N=N)))  # gen_primes()))
+        # trial division never needs a prime above sqrt(N)
+        p = sieve(math.isqrt(N) + 1).primes.tolist()
         i = 0
         # divide out the lowest numbers first so that as long as the
         # reduced n is composite, it must be greater than the square of the
         # next largest number (n>i^2).
 
-        while p[i] * p[i] <= n:
+        while i < len(p) and p[i] * p[i] <= n:
             while n % p[i] == 0:
                 yield p[i]  # n is divisible by i
-                n /= p[i]
+                n //= p[i]
             i += 1
 
         # the final reduced n is the last and largest non-composite (prime)
@@ -127,41 +786,298 @@ def prb(N):
     (y, c, m) = (random.randint(1, N - 1), random.randint(1, N - 1),
                  random.randint(1, N - 1))
     (g, r, q) = (1, 1, 1)
+    muls, gcds = 0, 0  # tallied per batch, for the work counters
     while g == 1:
         x = y
         for i in range(r):
             y = (y * y % N + c) % N
+        muls += r
         k = 0
         while k < r and g == 1:
             ys = y
             for i in range(min(m, r - k)):
                 y = (y * y % N + c) % N
                 q = q * abs(x - y) % N
-            g = fractions.gcd(q, N)
+            muls += 2 * min(m, r - k)
+            g = math.gcd(q, N)
+            gcds += 1
             k = k + m
         r = r * 2
     if g == N:
         while True:
             ys = (ys * ys % N + c) % N
-            g = fractions.gcd(abs(x - ys), N)
+            g = math.gcd(abs(x - ys), N)
+            muls += 1
+            gcds += 1
             if g > 1:
                 break
+    if _counters is not None:
+        _counters['prb.calls'] += 1
+        _counters['prb.modmuls'] += muls
+        _counters['prb.gcds'] += gcds
+        _counters['prb.failures'] += g == N
     return g
 
 
+# Factorization engine: trial division by the primes below 1000, then
+# Pollard-Brent on whatever is left, splitting every composite cofactor
+# until only primes (by the deterministic test below) remain.
+
+_TRIAL_PRIMES = _small_primes(1000).tolist()
+# Miller-Rabin bases deterministic for n < 2^64 (Jim Sinclair, 2011)
+_MR_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+FACTOR_CACHE_SIZE = 1 << 16
+
+
+def _miller_rabin(n, bases):
+    """strong probable prime test of the odd n > 2 to the given bases"""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _jacobi(a, n):
+    """Jacobi symbol (a/n) for odd n > 0"""
+    a, result = a % n, 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas(n):
+    """strong Lucas probable prime test of the odd n > 2 with Selfridge's
+    parameters (D the first of 5, -7, 9, -11, ... with (D/n) = -1)"""
+    r = math.isqrt(n)
+    if r * r == n:
+        return False
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and D % n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    # U_k, V_k and Q^k by binary expansion of d, starting from k = 1
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == '1':
+            U, V = (P * U + V) % n, (D * U + P * V) % n
+            U = (U + n if U & 1 else U) // 2
+            V = (V + n if V & 1 else V) // 2
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V, Qk = (V * V - 2 * Qk) % n, Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+def is_prime(n):
+    """primality of n; deterministic Miller-Rabin below 2^64 and the
+    Baillie-PSW test (no known counterexample) above"""
+    n = int(n)  # numpy integers would overflow in pow()
+    if n < 2:
+        return False
+    for p in _TRIAL_PRIMES[:25]:
+        if n % p == 0:
+            return n == p
+    if n < 2**64:
+        return _miller_rabin(n, _MR_BASES)
+    return _miller_rabin(n, (2,)) and _strong_lucas(n)
+
+
+def _is_prime32(n):
+    """vectorized is_prime of a uint64 array of values below 2^32: trial
+    division by the primes below 100, then Miller-Rabin to the bases 2, 7
+    and 61 (deterministic below 4759123141); every product fits 64 bits"""
+    res = n >= 2
+    todo = res.copy()
+    for p in _TRIAL_PRIMES[:25]:
+        hit = todo & (n % p == 0)
+        res[hit] = n[hit] == p
+        todo &= ~hit
+    m = n[todo]
+    d, s = m - 1, numpy.zeros(len(m), dtype=numpy.uint64)
+    while True:
+        even = (d & 1) == 0
+        if not even.any():
+            break
+        d[even] >>= 1
+        s[even] += 1
+    passed = numpy.ones(len(m), dtype=bool)
+    for a in (2, 7, 61):
+        # x = a^d mod m, square-and-multiply over the bits of d
+        x = numpy.ones(len(m), dtype=numpy.uint64)
+        b = numpy.full(len(m), a, dtype=numpy.uint64) % m
+        e = d.copy()
+        while e.any():
+            x = numpy.where(e & 1, x * b % m, x)
+            b = b * b % m
+            e >>= 1
+        ok = (x == 1) | (x == m - 1)
+        for r in range(1, int(s.max()) if len(s) else 0):
+            x = x * x % m
+            ok |= (x == m - 1) & (r < s)
+        passed &= ok
+    res[todo] = passed
+    return res
+
+
+def is_prime_many(candidates):
+    """is_prime of every element of an integer array or iterable, as a
+    bool array; values below 2^32 are tested together as arrays"""
+    a = numpy.asarray(candidates if hasattr(candidates, '__len__')
+                      else list(candidates))
+    if a.dtype.kind not in 'iu':  # e.g. object arrays of huge ints
+        return numpy.array([is_prime(int(n)) for n in a.ravel()],
+                           dtype=bool).reshape(a.shape)
+    out = numpy.zeros(a.shape, dtype=bool)
+    small = (a >= 0) & (a < 2**32)
+    out[small] = _is_prime32(a[small].astype(numpy.uint64))
+    big = numpy.flatnonzero(~small & (a > 0))
+    out.flat[big] = [is_prime(int(n)) for n in a.flat[big]]
+    return out
+
+
+@functools.lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def factorize(N):
+    """prime factors of N with multiplicity, as an ascending tuple;
+    results are kept in an LRU cache of FACTOR_CACHE_SIZE entries"""
+    n, factors = int(N), []
+    for p in _TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors.append(m)
+            continue
+        f = prb(m)
+        while f == m:  # unlucky constants; retry with new ones
+            f = prb(m)
+        stack += [f, m // f]
+    return tuple(sorted(factors))
+
+
 def pfactor(N, myprimes=None):
+    """prime factors of N with multiplicity, ascending (appended to
+    myprimes if given)"""
     if myprimes is None:
         myprimes = []
-    p = gmpy.mpz(N)
-    if p.is_prime() and prb(N) == N:
-        myprimes.append(N)
-    elif p > 1:
-        f = prb(N)
-        myprimes.append(f)
-        p = pfactor(int(N / f), myprimes)
+    myprimes.extend(factorize(N))
     return myprimes
 
 
+# Collatz chain lengths.  Chains are advanced for a whole block of
+# starting values at once (odd steps fused into (3n+1)/2) until each one
+# drops below a floor under which the lengths are already tabulated, so
+# only starting values below the bound are ever cached and the values of
+# an excursion above it are never stored.
+
+_collatz_state = {}
+
+
+def _collatz_block(lo, hi, L, floor):
+    """steps from each lo <= n < hi down to 1, given the lengths L[m]
+    of every m < floor"""
+    out = numpy.empty(hi - lo, dtype=numpy.int64)
+    idx = numpy.arange(hi - lo)
+    cur = idx + lo
+    steps = numpy.zeros(hi - lo, dtype=numpy.int64)
+    while len(idx):
+        odd = cur & 1
+        cur = numpy.where(odd, (3 * cur + 1) >> 1, cur >> 1)
+        steps += 1 + odd
+        done = cur < floor
+        out[idx[done]] = steps[done] + L[cur[done]]
+        keep = ~done
+        idx, cur, steps = idx[keep], cur[keep], steps[keep]
+    return out
+
+
+def collatz_lengths(N, block=1 << 20):
+    """number of Collatz steps from n down to 1 for every n < N (0 for
+    n < 2), as a uint16 array"""
+    L = numpy.zeros(max(N, 2), dtype=numpy.uint16)
+    lo = 2
+    while lo < N:
+        # below 2*lo every even start drops under the floor in one step
+        hi = min(2 * lo, lo + block, N)
+        L[lo:hi] = _collatz_block(lo, hi, L, lo)
+        lo = hi
+    return L[:N]
+
+
+def _collatz_init(L):
+    _collatz_state['L'] = L
+
+
+def _collatz_task(bounds):
+    lo, hi = bounds
+    L = _collatz_state['L']
+    out = _collatz_block(lo, hi, L, len(L))
+    i = int(out.argmax())
+    return lo + i, int(out[i])
+
+
+def longest_collatz(N, processes=None, block=1 << 20):
+    """(n, steps) for the n < N with the longest Collatz chain (the
+    smallest such n on ties); with processes > 1 the lengths below
+    N/(2*processes) (at least 4M) are tabled serially and the rest are
+    split over a process pool that follows each chain down to the
+    table"""
+    if N <= 2:
+        return 1, 0
+    if not processes or processes == 1:
+        L = collatz_lengths(N, block)
+        n = int(L.argmax())
+        return n, int(L[n])
+    L = collatz_lengths(min(N, max(1 << 22, N // (2 * processes))), block)
+    n = int(L.argmax())
+    best = (n, int(L[n]))
+    tasks = [(lo, min(lo + block, N)) for lo in range(len(L), N, block)]
+    with Pool(processes, _collatz_init, (L,)) as pool:
+        for n, c in pool.map(_collatz_task, tasks, chunksize=1):
+            if c > best[1]:
+                best = (n, c)
+    return best
+
+
 def gen_fib():
     # fibonacci generator; since we need to sum all elements, no
     # need to use optimized expression to extract element N
@@ -171,10 +1087,34 @@ def gen_fib():
         a, b = b, a+b
 
 
+def sum_proper_divs_blocks(N=1000, block=1 << 20):
+    """s(n), the sum of the proper divisors of n, for 0 <= n <= N as
+    int64 arrays of up to 'block' consecutive values.  Divisors come in
+    pairs i*k = n with i <= k, so for every i <= sqrt(n) one slice-add
+    of i + k over the multiples of i covers both members of each pair.
+    """
+    for lo in range(0, N + 1, block):
+        hi = min(lo + block, N + 1)
+        A = numpy.zeros(hi - lo, dtype=numpy.int64)
+        A[max(2 - lo, 0):] += 1  # the pair (1, n) contributes only 1
+        for i in range(2, math.isqrt(hi - 1) + 1):
+            k0 = max(i, -(-lo // i))
+            if i * k0 >= hi:
+                continue
+            k1 = (hi - 1) // i
+            A[i*k0 - lo::i] += i + numpy.arange(k0, k1 + 1)
+            if k0 == i:
+                A[i*i - lo] -= i  # i*i = n counts its square root once
+        yield A
+
+
+def sum_proper_divs_array(N=1000):
+    """s(n) for 0 <= n <= N as one int64 array"""
+    return numpy.concatenate(list(sum_proper_divs_blocks(N)))
+
+
 def sum_proper_divs(N=1000):
-    A = [0]*(N+1)
-    yield A[0]
-    for i in range(1,N+1):
-        for j in range(2*i,N+1,i):
-            A[j] += i
-        yield A[i]
+    """generate s(n) for 0 <= n <= N"""
+    for A in sum_proper_divs_blocks(N):
+        for a in A.tolist():
+            yield a
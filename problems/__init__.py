@@ -0,0 +1,41 @@
+"""Registry of the solutions: one module per problem, imported on demand.
+
+A solution pN* (p4, p4b, p21_fast, p1_ana, ...) lives in problems/pN.py,
+and each module imports only what its own solutions need, so sympy,
+numpy, gmpy and scipy load only when a problem that uses them runs.
+The registry is built by parsing the module sources, never by importing
+them.
+"""
+import os
+import re
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+NAME_RE = re.compile(r'^p(\d+)\w*$')
+
+# 'import solutions' in a fresh interpreter must stay under this
+IMPORT_BUDGET_MS = 50
+
+
+def module_for(name):
+    """dotted name of the module defining solution 'name', or None"""
+    m = NAME_RE.match(name)
+    if m is None or not os.path.exists(
+            os.path.join(HERE, 'p%s.py' % m.group(1))):
+        return None
+    return 'problems.p%s' % m.group(1)
+
+
+def names(analysis=False):
+    """the solution functions of all problem modules in problem order;
+    the pN_ana analysis helpers only with analysis=True"""
+    import ast
+    found = []
+    for fn in os.listdir(HERE):
+        if NAME_RE.match(fn[:-3]) and fn.endswith('.py'):
+            with open(os.path.join(HERE, fn)) as f:
+                tree = ast.parse(f.read())
+            found += [node.name for node in tree.body
+                      if isinstance(node, ast.FunctionDef)
+                      and NAME_RE.match(node.name)
+                      and (analysis or not node.name.endswith('_ana'))]
+    return sorted(found, key=lambda n: (int(NAME_RE.match(n).group(1)), n))
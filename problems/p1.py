@@ -0,0 +1,40 @@
+"""Project Euler problem 1."""
+
+import operator as op
+from functools import reduce
+from itertools import takewhile, repeat
+
+from solutions import timeit, part
+
+
+@timeit
+def p1(lt=1000):
+    """P1: 'Find the sum of all the multiples of 3 or 5 below 1000.'"""
+    def mod35Gen():
+        # see p1_ana; use 7-number cycle in n(i+1)-n(i) of mult-3,5
+        # number sequence to generate series
+        toadd = [3, 2, 1, 3, 1, 2, 3]
+        a = 0
+        i = 0
+        while 1:
+            a += toadd[i]
+            yield a
+            i = 0 if i >= 6 else i+1
+
+    g = mod35Gen()
+    # sum elements of mod3||mod5 series up to value 'lt'
+    return reduce(op.add, takewhile(lambda x: x < lt, g))
+
+
+def p1_ana():
+    # some observations about series of mult-3,5 numbers
+    l1 = [i for i in range(0, 374) if i % 3 == 0 or i % 5 == 0]
+    l2 = [i for i in range(3, 377) if i % 3 == 0 or i % 5 == 0]
+    toadd = [x2 - x1 for x1, x2 in zip(l1, l2)]
+    toadd2 = part(toadd, 7)
+    msg = 'Notice the pattern of n(i+1)-n(i):'
+    msglen = len(msg)
+    print(msg + '\n' + ''.join(repeat('=', msglen)))
+    seqstrlen = len(str(toadd2[0]))
+    for n7 in toadd2:
+        print(str("%%+%ds" % (msglen-(msglen-seqstrlen+2)/2)) % str(n7))
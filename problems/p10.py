@@ -0,0 +1,11 @@
+"""Project Euler problem 10."""
+
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p10(N=10):
+    """Find the sum of all the primes below two million."""
+    return nttools.prime_sum(N)  # primes <= N, as sum(sieveErat(N)) was
@@ -0,0 +1,24 @@
+"""Project Euler problem 12."""
+
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p12(N=5, N0=1):
+    """What is the value of the first triangle number to have over five
+    hundred divisors?
+    """
+    # i and i+1 are coprime, so d(i(i+1)/2) is a product of two table
+    # entries once the factor 2 is taken from the even one
+    d = nttools.multiplicative_sieve(N+2, which=('d',))['d']
+    n = N0
+    for i in range(N0, N+1):
+        n = i*(i+1)//2
+        a, b = (i//2, i+1) if i % 2 == 0 else (i, (i+1)//2)
+        nfs = int(d[a])*int(d[b])
+        if nfs >= 500:
+            print(i, nfs, n)
+            break
+    return int(n)
@@ -0,0 +1,13 @@
+"""Project Euler problem 14."""
+
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p14(N1=1000000):
+    """Which starting number, under one million, produces the longest
+    chain in its Collatz sequence?
+    """
+    return nttools.longest_collatz(N1+1)
@@ -0,0 +1,10 @@
+"""Project Euler problem 16."""
+
+from functools import reduce
+
+from solutions import timeit
+
+
+@timeit
+def p16(N=1000):
+    return reduce(lambda x, y: int(x)+int(y), list(str(2**N)))
@@ -0,0 +1,19 @@
+"""Project Euler problem 19."""
+
+import datetime as dt
+
+from solutions import timeit
+
+
+@timeit
+def p19():
+    """Cheap or cheat?  Used existing calendar functionality.
+    """
+    def daterange(d0, d1):
+        d1 = d1 + dt.timedelta(1)
+        for n in range(int((d1-d0).days)):
+            yield d0 + dt.timedelta(n)
+    a = dt.date(1901, 1, 1)
+    b = dt.date(2000, 12, 31)
+    wdayson1st = [d.weekday() for d in daterange(a, b) if d.day == 1]
+    return len([wday for wday in wdayson1st if wday == 6])
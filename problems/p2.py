@@ -0,0 +1,23 @@
+"""Project Euler problem 2."""
+
+import operator as op
+from functools import reduce
+from itertools import takewhile
+import fibonacci
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p2(lt=4000000, fltr=None):
+    """P2: By considering the terms in the Fibonacci sequence whose
+    values do not exceed four million, find the sum of the even-valued
+    terms.
+    """
+    if fltr is None:
+        # the even terms have a closed-form sum
+        return fibonacci.even_sum(lt)
+    fg = nttools.gen_fib()
+    # filter and sum elements of fibonacci series up to value 'lt'
+    return reduce(op.add, filter(fltr, takewhile(lambda x: x < lt, fg)))
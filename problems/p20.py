@@ -0,0 +1,10 @@
+"""Project Euler problem 20."""
+
+import math
+
+from solutions import timeit
+
+
+@timeit
+def p20():
+    return sum([int(digit) for digit in str(math.factorial(100))])
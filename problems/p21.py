@@ -0,0 +1,21 @@
+"""Project Euler problem 21."""
+
+import numpy
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p21(N=10000):
+    A = nttools.multiplicative_sieve(N, which=('s',))['s']
+    i = numpy.arange(N)
+    amicable = (i > 1) & (A < N) & (A != i)
+    amicable[amicable] = A[A[amicable]] == i[amicable]
+    return int(i[amicable].sum())
+
+
+@timeit
+def p21_fast(N=10000):
+    A = nttools.sum_proper_divs_array(N).tolist()
+    return sum([i for i in range(2,N) if A[i] < N and A[A[i]]==i and i!=A[i]])
@@ -0,0 +1,9 @@
+"""Project Euler problem 22."""
+
+from solutions import timeit
+
+
+@timeit
+def p22():
+    with open('names.txt') as f: names=sorted([n.strip('"') for n in f.read().split(',')])
+    return sum(sum(ord(c)-64 for c in s)*i for i,s in enumerate(names,1))
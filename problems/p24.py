@@ -0,0 +1,11 @@
+"""Project Euler problem 24."""
+
+import combinatorics
+
+from solutions import timeit
+
+
+@timeit
+def p24(N=1000000, digits=range(0, 10)):
+    """the Nth lexicographic permutation of the digits"""
+    return combinatorics.perm_unrank(N - 1, digits)
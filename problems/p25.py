@@ -0,0 +1,11 @@
+"""Project Euler problem 25."""
+
+import fibonacci
+
+from solutions import timeit
+
+
+@timeit
+def p25(D=1000):
+    n = fibonacci.first_with_digits(D)
+    return (n, fibonacci.fib(n))
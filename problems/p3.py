@@ -0,0 +1,16 @@
+"""Project Euler problem 3."""
+
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p3(N=600851475143):
+    """P3: What is the largest prime factor of the number 600851475143?
+    """
+    # First attempt was to use a prime sieve first and then filter
+    # the factors, but my naive prime sieve (Eratosthenes)
+    # implementation ran into performance issues. This version uses
+    # the Pollard-Rho-Brent algorithm -- very, very efficient.
+    return max(nttools.pfactor(N))
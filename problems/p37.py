@@ -0,0 +1,28 @@
+"""Project Euler problem 37."""
+
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p37():
+    """The number 3797 has an interesting property. Being prime itself,
+    it is possible to continuously remove digits from left to right,
+    and remain prime at each stage: 3797, 797, 97, and 7. Similarly we
+    can work from right to left: 3797, 379, 37, and 3.
+
+    Find the sum of the only eleven primes that are both truncatable
+    from left to right and right to left.
+    """
+    # every right-truncatable prime grows from a single-digit prime by
+    # appending 1, 3, 7 or 9, and there are only finitely many of them;
+    # keep those that are also left-truncatable
+    isprime = nttools.is_prime
+    found, layer = [], [2, 3, 5, 7]
+    while layer:
+        layer = [10*n + d for n in layer for d in (1, 3, 7, 9)
+                 if isprime(10*n + d)]
+        found += [n for n in layer
+                  if all(isprime(int(str(n)[i:])) for i in range(1, len(str(n))))]
+    return sum(found)
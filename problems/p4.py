@@ -0,0 +1,33 @@
+"""Project Euler problem 4."""
+
+import palindromes
+
+from solutions import timeit
+
+
+@timeit
+def p4(n=3):
+    """Find the largest palindrome made from the product of two 3-digit
+    numbers.
+    """
+    # walk the palindromes down from the top, testing each for a pair of
+    # n-digit factors
+    return palindromes.largest_palindrome_product(n)[0]
+
+
+@timeit
+def p4b(n=3):
+    """Find the largest palindrome made from the product of two 3-digit
+    numbers.
+    """
+    # walk the products down instead, pruning rows that cannot win
+    return str(palindromes.palindrome_product_scan(n)[0])
+
+
+@timeit
+def p4numpy(n=3):
+    """Find the largest palindrome made from the product of two 3-digit
+    numbers.
+    """
+    # the factor test of each palindrome is one numpy array operation
+    print(palindromes.largest_palindrome_product(n)[0])
@@ -0,0 +1,12 @@
+"""Project Euler problem 47."""
+
+import nttools
+from solutions import timeit
+
+
+@timeit
+def p47(ndistinct=4, streak=4, Nmin=1000, Nmax=1000000):
+    """first of 'streak' consecutive integers in [Nmin, Nmax] onwards with
+    'ndistinct' distinct prime factors each, or -1"""
+    n = nttools.omega_streak(ndistinct, streak, Nmin, Nmax + streak)
+    return -1 if n is None else n
@@ -0,0 +1,25 @@
+"""Project Euler problem 5."""
+
+import operator as op
+from functools import reduce
+from collections import Counter
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p5(N=20):
+    """What is the smallest positive number that is evenly divisible
+    by all of the numbers from 1 to 20?
+    """
+    # Factors of smallest number evenly divisible by every number
+    # from 1 to N given as follows:  from all numbers between 2 and
+    # N, take the maximum multiplicity (n_i) of each factor (i).
+    fcounters = [Counter(f) for f in nttools.factor_many(range(2, N+1))]
+    #could also have used pfactor(n) or pfactorGen(n) one at a time
+    factors = Counter()
+    for fc in fcounters:
+        for k, v in fc.items():
+            factors[k] = v if v > factors[k] else factors[k]
+    return reduce(op.mul, [k**v for k, v in factors.items()], 1)
@@ -0,0 +1,13 @@
+"""Project Euler problem 6."""
+
+from itertools import combinations
+
+from solutions import timeit
+
+
+@timeit
+def p6(N=100):
+    """Find the difference between the sum of the squares of the first
+    one hundred natural numbers and the square of the sum.
+    """
+    return sum(2*i*j for i, j in combinations(range(1, N+1), 2))
@@ -0,0 +1,14 @@
+"""Project Euler problem 613."""
+
+from solutions import timeit
+
+
+@timeit
+def p613():
+    from scipy.integrate import dblquad
+    from numpy import arctan2 as atan2
+    from math import pi
+
+    g = lambda x, y: (atan2(40-y, -x)-atan2(-y,30-x))/(2*pi*30*40/2.0)
+    return dblquad(g, 0, 40, lambda x: 0, lambda x: 30-3.0/4*x,
+                   epsabs = 1e-10)
@@ -0,0 +1,9 @@
+"""Project Euler problem 67."""
+
+import triangles
+from solutions import timeit
+
+
+@timeit
+def p67(fn='triangle.txt'):
+    return triangles.max_path_file(fn)
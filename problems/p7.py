@@ -0,0 +1,32 @@
+"""Project Euler problem 7."""
+
+import nttools
+
+from solutions import timeit
+
+
+@timeit
+def p7(N=10001):
+    """What is the 10001st prime number?"""
+    # count whole sieve segments until the one holding the Nth prime
+    seen = 0
+    for block in nttools.prime_blocks():
+        if seen + len(block) >= N:
+            return int(block[N-1-seen])
+        seen += len(block)
+
+
+@timeit
+def p7alt2(N=10001):
+    """What is the 10001st prime number?"""
+    for i, p in enumerate(nttools.primes()):
+        if i >= N-1:
+            return p
+            break
+    return -1
+
+
+@timeit
+def p7alt(nth=10001):
+    """What is the 10001st prime number?"""
+    return nttools.nth_prime(nth)
@@ -0,0 +1,15 @@
+"""Project Euler problem 9."""
+
+from solutions import timeit
+
+
+@timeit
+def p9():
+    """There exists exactly one Pythagorean triplet for which
+    a + b + c = 1000.  Find the product abc.
+    """
+    for b in range(1, 1000):
+        for a in range(1, b):
+            c = pow(a**2+b**2, 0.5)
+            if a+b+c == 1000:
+                return a*b*c
@@ -0,0 +1,160 @@
+"""Opt-in profiling of solutions without touching their bodies.
+
+The timeit decorator in solutions.py asks mode_for(name) before every
+call; when a mode is set the call goes through run() instead.  Modes are
+chosen per problem with the PE_PROFILE environment variable (or the
+runner's --profile flag), e.g.
+
+    PE_PROFILE='p14=cprofile,p21_fast=tracemalloc,p50*=sample'
+    PE_PROFILE='*=cprofile'
+
+and the output lands in PE_PROFILE_DIR (default ./profiles):
+
+    cprofile     NAME.pstats, for pstats/snakeviz/gprof2dot
+    tracemalloc  NAME.tracemalloc.txt: peak and the top allocation sites
+                 near the peak (sampled every PE_SAMPLE_MS ms of CPU time)
+    sample       NAME.folded: stacks sampled every PE_SAMPLE_MS ms of CPU
+                 time, in the folded format of flamegraph.pl/speedscope
+"""
+import fnmatch
+import functools
+import os
+import sys
+from collections import Counter
+
+MODES = ('cprofile', 'tracemalloc', 'sample')
+# the profilers themselves are imported only when a mode is used, to keep
+# 'import solutions' cheap
+
+
+@functools.lru_cache(maxsize=8)
+def _parse(spec):
+    rules = []
+    for item in spec.split(','):
+        if item.strip():
+            pattern, _, mode = item.strip().rpartition('=')
+            if mode not in MODES:
+                raise ValueError('unknown profiling mode %r in PE_PROFILE'
+                                 % mode)
+            rules.append((pattern or '*', mode))
+    return tuple(rules)
+
+
+def mode_for(name):
+    """the profiling mode PE_PROFILE selects for 'name', or None"""
+    spec = os.environ.get('PE_PROFILE')
+    if not spec:
+        return None
+    for pattern, mode in _parse(spec):
+        if fnmatch.fnmatch(name, pattern):
+            return mode
+    return None
+
+
+def _path(name, suffix):
+    outdir = os.environ.get('PE_PROFILE_DIR', 'profiles')
+    os.makedirs(outdir, exist_ok=True)
+    return os.path.join(outdir, name + suffix)
+
+
+def _cprofile(name, func, args, kw):
+    import cProfile
+    prof = cProfile.Profile()
+    try:
+        return prof.runcall(func, *args, **kw)
+    finally:
+        path = _path(name, '.pstats')
+        prof.dump_stats(path)
+        sys.stderr.write('%s: cProfile stats in %s\n' % (name, path))
+
+
+def _tracemalloc(name, func, args, kw, top=25):
+    import signal
+    import time
+    import tracemalloc
+    interval = float(os.environ.get('PE_SAMPLE_MS', '1')) / 1000
+    # what is left after func returns says little about its peak, so the
+    # allocation sites are snapshotted while it runs, whenever the traced
+    # memory has grown 10% past the last snapshot (checked on the CPU-time
+    # timer _sample uses).  The timer is off while a snapshot is taken,
+    # and the next check waits 10x as long as the snapshot took, so at
+    # most ~10% of the run goes into snapshots.
+    best = {'size': -1, 'snapshot': None, 'busy': False}
+
+    def grab():
+        size = tracemalloc.get_traced_memory()[0]
+        if size <= best['size'] * 1.1:
+            return 0.0
+        t0 = time.process_time()
+        best['size'], best['snapshot'] = size, tracemalloc.take_snapshot()
+        return time.process_time() - t0
+
+    def handler(signum, frame):
+        if best['busy']:  # a tick that slipped in before the timer stopped
+            return
+        best['busy'] = True
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        try:
+            pause = max(interval, 10 * grab())
+        finally:
+            best['busy'] = False
+        signal.setitimer(signal.ITIMER_PROF, pause, interval)
+
+    tracemalloc.start(25)
+    old = signal.signal(signal.SIGPROF, handler)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        return func(*args, **kw)
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, old)
+        grab()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        stats = best['snapshot'].statistics('lineno')
+        path = _path(name, '.tracemalloc.txt')
+        with open(path, 'w') as f:
+            f.write('peak %d bytes, %d still allocated\n'
+                    'allocation sites when %d bytes were allocated:\n\n'
+                    % (peak, current, best['size']))
+            for stat in stats[:top]:
+                f.write('%s\n' % stat)
+        sys.stderr.write('%s: peak %.1f MiB, allocation sites in %s\n'
+                         % (name, peak / 2.0**20, path))
+
+
+def _sample(name, func, args, kw):
+    import signal
+    interval = float(os.environ.get('PE_SAMPLE_MS', '1')) / 1000
+    stacks = Counter()
+
+    def handler(signum, frame):
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append('%s:%s' % (os.path.basename(code.co_filename),
+                                     code.co_name))
+            frame = frame.f_back
+        stacks[';'.join(reversed(frames))] += 1
+
+    old = signal.signal(signal.SIGPROF, handler)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        return func(*args, **kw)
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, old)
+        path = _path(name, '.folded')
+        with open(path, 'w') as f:
+            for stack, count in stacks.most_common():
+                f.write('%s %d\n' % (stack, count))
+        sys.stderr.write('%s: %d samples in %s\n'
+                         % (name, sum(stacks.values()), path))
+
+
+def run(mode, name, func, args=(), kw=None):
+    """call func(*args, **kw) under profiling 'mode', writing the output
+    for 'name'; returns what func returns"""
+    runner = {'cprofile': _cprofile, 'tracemalloc': _tracemalloc,
+              'sample': _sample}[mode]
+    return runner(name, func, args, kw or {})
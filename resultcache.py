@@ -0,0 +1,223 @@
+"""Persistent memo of solution results across runs.
+
+Results are stored in an SQLite file (results.sqlite in PE_CACHE_DIR,
+default ~/.cache/project-euler) under a key hashed from the solution's
+name, the repr of its arguments and the source of its module and of every
+module of this repository that it imports, directly or not (nttools,
+combinatorics, ...), so editing a solution or an engine it calls
+invalidates its entries automatically.  The contents of data files are
+hashed in too: arguments (defaults included) that name an existing file,
+and string literals of the solution's module that do (names.txt, ...).
+Digests are kept per process while a file's mtime and size hold, so a
+hit costs a stat() per file rather than a re-read.  The file is kept below
+PE_RESULT_CACHE_MB megabytes (default 256) by evicting the least
+recently used entries.  Calls whose arguments have no stable repr, or
+whose results cannot be pickled, are simply not cached.
+
+The timeit decorator in solutions.py consults it when solutions.cacheON
+is set, when PE_RESULT_CACHE=1, or under runner.py --cache.  Changes to
+installed packages (numpy, sympy, ...) are not seen; clear() drops
+everything.
+"""
+import os
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MAX_MB = float(os.environ.get('PE_RESULT_CACHE_MB', '256'))
+
+
+def enabled():
+    """whether PE_RESULT_CACHE asks for the cache"""
+    return os.environ.get('PE_RESULT_CACHE', '') not in ('', '0')
+
+
+def _path():
+    cache_dir = os.environ.get(
+        'PE_CACHE_DIR',
+        os.path.join(os.path.expanduser('~'), '.cache', 'project-euler'))
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, 'results.sqlite')
+
+
+def _connect():
+    import sqlite3
+    db = sqlite3.connect(_path(), timeout=30)
+    db.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, '
+               'name TEXT, value BLOB, size INTEGER, atime REAL)')
+    return db
+
+
+def _module_path(name):
+    """the file of the repository module 'name', or None"""
+    base = os.path.join(HERE, *name.split('.'))
+    for path in (base + '.py', os.path.join(base, '__init__.py')):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+_parsed = {}  # path -> ((mtime, size), (digest, imports, strings))
+_digests = {}  # data file -> ((mtime, size), digest)
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _parse(path):
+    """(sha256, imported module names, string literals) of the source file
+    'path'; parsed once per process for as long as its mtime and size
+    hold"""
+    import ast
+    import hashlib
+    stamp = _stamp(path)
+    hit = _parsed.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    with open(path, 'rb') as f:
+        source = f.read()
+    names, strings = [], set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names += [a.name for a in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module \
+                and not node.level:
+            # 'from pkg import mod' may name a submodule
+            names += [node.module] + ['%s.%s' % (node.module, a.name)
+                                      for a in node.names]
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) \
+                and 0 < len(node.value) < 256 and '\n' not in node.value:
+            strings.add(node.value)
+    info = (hashlib.sha256(source).digest(), names, strings)
+    _parsed[path] = (stamp, info)
+    return info
+
+
+def _local_sources(path):
+    """{path: sha256} of the file 'path' and of the repository modules it
+    imports, followed transitively (found by parsing, not importing)"""
+    sources, todo = {}, [path]
+    while todo:
+        path = todo.pop()
+        if path in sources:
+            continue
+        sources[path], names, _ = _parse(path)
+        todo += [p for p in map(_module_path, names) if p]
+    return sources
+
+
+def _data_files(names):
+    """{name: sha256} of those of 'names' that are existing files, taken
+    relative to the current directory as the solutions open them"""
+    import hashlib
+    files = {}
+    for name in names:
+        try:
+            if not os.path.isfile(name):
+                continue
+            path = os.path.abspath(name)
+            stamp = _stamp(path)
+        except (OSError, ValueError):
+            continue
+        hit = _digests.get(path)
+        if hit is None or hit[0] != stamp:
+            h = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    h.update(block)
+            hit = _digests[path] = (stamp, h.digest())
+        files[name] = hit[1]
+    return files
+
+
+def _key(func, args, kw):
+    """hash of name, arguments, module sources and the data files named by
+    the arguments (defaults included) or by string literals of the
+    solution's module; None if unkeyable"""
+    import hashlib
+    import inspect
+    argrepr = repr((args, sorted(kw.items())))
+    if ' at 0x' in argrepr:  # lambdas, objects: no stable identity
+        return None
+    try:
+        path = inspect.getsourcefile(func)
+        sources = _local_sources(path)
+    except (OSError, TypeError, SyntaxError):
+        return None
+    names = set(_parse(path)[2])
+    try:
+        bound = inspect.signature(func).bind(*args, **kw)
+        bound.apply_defaults()
+        values = bound.arguments.values()
+    except (TypeError, ValueError):
+        values = list(args) + list(kw.values())
+    names.update(os.fspath(v) for v in values
+                 if isinstance(v, (str, os.PathLike)))
+    files = _data_files(names)
+    h = hashlib.sha256()
+    for part in (func.__module__, func.__qualname__, argrepr):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    for path in sorted(sources):
+        h.update(os.path.relpath(path, HERE).encode('utf-8'))
+        h.update(b'\0')
+        h.update(sources[path])
+    for name in sorted(files):
+        h.update(name.encode('utf-8', 'surrogateescape'))
+        h.update(b'\0')
+        h.update(files[name])
+    return h.hexdigest()
+
+
+def lookup(func, args=(), kw=None):
+    """(True, result) if func(*args, **kw) is cached, else (False, None)"""
+    import pickle
+    key = _key(func, args, kw or {})
+    if key is None:
+        return False, None
+    with _connect() as db:
+        row = db.execute('SELECT value FROM results WHERE key = ?',
+                         (key,)).fetchone()
+        if row is None:
+            return False, None
+        db.execute('UPDATE results SET atime = ? WHERE key = ?',
+                   (time.time(), key))
+    return True, pickle.loads(row[0])
+
+
+def store(func, args, kw, result):
+    """remember result of func(*args, **kw), evicting old entries"""
+    import pickle
+    key = _key(func, args, kw or {})
+    if key is None:
+        return
+    try:
+        value = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return
+    with _connect() as db:
+        db.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                   (key, func.__qualname__, value, len(value), time.time()))
+        _evict(db, int(MAX_MB * 2**20))
+
+
+def _evict(db, max_bytes):
+    total = db.execute('SELECT COALESCE(SUM(size), 0) FROM results')
+    excess = total.fetchone()[0] - max_bytes
+    if excess <= 0:
+        return
+    doomed = []
+    for key, size in db.execute('SELECT key, size FROM results '
+                                'ORDER BY atime'):
+        if excess <= 0:
+            break
+        doomed.append((key,))
+        excess -= size
+    db.executemany('DELETE FROM results WHERE key = ?', doomed)
+
+
+def clear():
+    """drop every cached result"""
+    with _connect() as db:
+        db.execute('DELETE FROM results')
@@ -0,0 +1,189 @@
+#!/usr/bin/python
+"""Run the solutions in parallel, every one in its own process.
+
+Discovers the solutions in the problems registry and the standalone
+pN*.py scripts, runs them on up to JOBS processes at a time with a per-task
+timeout and address-space cap, and reports status, wall time and answer.
+
+    python runner.py [-j JOBS] [-t SECONDS] [-m MB] [--json FILE]
+                     [--profile MODE] [--cache] [PATTERN ...]
+
+PATTERNs are shell-style globs on the task names, e.g. 'p4*' or 'p47.py'.
+"""
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import multiprocessing as mp
+import os
+import re
+import resource
+import runpy
+import signal
+import sys
+import time
+import traceback
+from collections import namedtuple
+from multiprocessing.connection import wait
+
+import problems
+import profiling
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOLUTION_RE = re.compile(r'^p(\d+)\w*$')
+
+Result = namedtuple('Result', 'name status seconds answer')
+
+
+def _order(name):
+    return int(SOLUTION_RE.match(name.replace('.py', '')).group(1)), name
+
+
+def discover():
+    """task names: the solutions in the problems registry (found without
+    importing them) followed by the standalone pN*.py scripts"""
+    scripts = [fn for fn in os.listdir(HERE)
+               if fn.endswith('.py') and SOLUTION_RE.match(fn[:-3])]
+    return problems.names() + sorted(scripts, key=_order)
+
+
+def _child(name, mem_mb, profile, cache, conn):
+    # a process group of its own, so _kill() also takes down any pool
+    # workers the task starts
+    os.setpgrp()
+    os.chdir(HERE)
+    sys.path.insert(0, HERE)
+    if profile:
+        os.environ['PE_PROFILE'] = '%s=%s' % (name, profile)
+    if cache:
+        os.environ['PE_RESULT_CACHE'] = '1'
+    if mem_mb:
+        limit = mem_mb << 20
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    out = io.StringIO()
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(out):
+            if name.endswith('.py'):
+                if profile:
+                    profiling.run(profile, name[:-3], runpy.run_path,
+                                  (name,), {'run_name': '__main__'})
+                else:
+                    runpy.run_path(name, run_name='__main__')
+                answer = None
+            else:
+                import solutions
+                solutions.stdoutON = False
+                answer = getattr(solutions, name)()
+        # scripts (and solutions that only print) answer on stdout
+        answer = out.getvalue().strip() or None if answer is None \
+            else repr(answer)
+        conn.send(('ok', time.perf_counter() - t0, answer))
+    except BaseException:
+        conn.send(('error', time.perf_counter() - t0,
+                   traceback.format_exc().strip().splitlines()[-1]))
+    finally:
+        conn.close()
+
+
+def _kill(proc):
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:  # gone already, or not yet in its own group
+        proc.kill()
+
+
+def run(names, jobs=None, timeout=60.0, mem_mb=None, report=None,
+        profile=None, cache=False):
+    """run the tasks 'names' on up to 'jobs' processes; returns a list of
+    Results in the order of 'names'.  'report' is called with each Result
+    as it comes in; 'profile' is a profiling.MODES entry applied to every
+    task, and 'cache' turns on the result cache for the solutions."""
+    jobs = jobs or os.cpu_count()
+    pending, running, results = list(names), {}, {}
+
+    def finish(name, status, seconds, answer):
+        proc, conn, _ = running.pop(name)
+        conn.close()
+        proc.join()
+        results[name] = Result(name, status, seconds, answer)
+        if report:
+            report(results[name])
+
+    # not daemonic: daemonic processes cannot start a Pool (psieve,
+    # longest_collatz, ...); instead every child is killed on the way out
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                name = pending.pop(0)
+                recv, send = mp.Pipe(duplex=False)
+                proc = mp.Process(target=_child,
+                                  args=(name, mem_mb, profile, cache, send))
+                proc.start()
+                send.close()
+                running[name] = (proc, recv, time.perf_counter())
+            conns = {conn: name for name, (_, conn, _) in running.items()}
+            for conn in wait(list(conns), timeout=0.05):
+                name = conns[conn]
+                try:
+                    status, seconds, answer = conn.recv()
+                except EOFError:
+                    # killed without reporting, e.g. by the OOM killer
+                    proc = running[name][0]
+                    proc.join()
+                    status, answer = 'crashed', 'exit code %s' % proc.exitcode
+                    seconds = time.perf_counter() - running[name][2]
+                finish(name, status, seconds, answer)
+            now = time.perf_counter()
+            for name, (proc, _, t0) in list(running.items()):
+                if timeout and now - t0 > timeout:
+                    _kill(proc)
+                    finish(name, 'timeout', now - t0, None)
+    finally:
+        for proc, conn, _ in running.values():
+            _kill(proc)
+            conn.close()
+            proc.join()
+    return [results[name] for name in names]
+
+
+def _print_result(r):
+    print('%-12s %-8s %9.3fs  %s' % (r.name, r.status, r.seconds,
+                                     '' if r.answer is None else r.answer))
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('patterns', nargs='*', metavar='PATTERN')
+    ap.add_argument('-j', '--jobs', type=int, default=os.cpu_count())
+    ap.add_argument('-t', '--timeout', type=float, default=60.0,
+                    help='seconds per task, 0 for none (default 60)')
+    ap.add_argument('-m', '--memory', type=int, default=None, metavar='MB',
+                    help='address-space cap per task')
+    ap.add_argument('--json', metavar='FILE', help='also write results here')
+    ap.add_argument('--profile', choices=profiling.MODES,
+                    help='profile every task; output goes to ./profiles')
+    ap.add_argument('--cache', action='store_true',
+                    help='reuse cached results of unchanged solutions')
+    args = ap.parse_args(argv)
+
+    names = discover()
+    if args.patterns:
+        names = [n for n in names
+                 if any(fnmatch.fnmatch(n, p) for p in args.patterns)]
+    t0 = time.perf_counter()
+    results = run(names, args.jobs, args.timeout, args.memory, _print_result,
+                  args.profile, args.cache)
+    print('%d tasks, %d ok, %.3fs wall' % (
+        len(results), sum(r.status == 'ok' for r in results),
+        time.perf_counter() - t0))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump([r._asdict() for r in results], f, indent=1)
+    return 0 if all(r.status == 'ok' for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Maximum top-to-bottom path through a number triangle (p18, p67).
+
+The triangle is folded from the bottom up, so only one row of partial
+sums is alive at a time: best[i] is the largest sum of a path from
+position i of the current row down to the base.  Files are read
+backwards through mmap, one line at a time, so the whole triangle is
+never in memory, and the input is never modified.  For the argmax path
+the only extra storage is one bit per entry (which child won).
+"""
+import mmap
+
+import numpy
+
+
+def rows_bottom_up(fn):
+    """the rows of the triangle file 'fn' as int64 arrays, last row first"""
+    with open(fn, 'rb') as f:
+        try:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with m:
+            end = len(m)
+            while end > 0:
+                start = m.rfind(b'\n', 0, end) + 1
+                line = m[start:end]
+                if line.strip():
+                    yield numpy.array(line.split(), dtype=numpy.int64)
+                end = start - 1
+
+
+def max_path(rows, path=False):
+    """largest top-to-bottom path sum of a triangle given by its rows,
+    bottom row first; with path=True returns (sum, columns), the column
+    of the path in every row from the top down"""
+    best, choices = None, []
+    for row in rows:
+        row = numpy.asarray(row, dtype=numpy.int64)
+        if best is None:
+            best = row
+            continue
+        if len(row) != len(best) - 1:
+            raise ValueError('row of %d entries above a row of %d'
+                             % (len(row), len(best)))
+        right = best[1:] > best[:-1]
+        best = row + numpy.where(right, best[1:], best[:-1])
+        if path:
+            choices.append(numpy.packbits(right))
+    if best is None or len(best) != 1:
+        raise ValueError('not a triangle: the top row must have 1 entry')
+    if not path:
+        return int(best[0])
+    cols = [0]
+    for bits in reversed(choices):
+        c = cols[-1]
+        cols.append(c + int(bits[c >> 3] >> (7 - (c & 7)) & 1))
+    return int(best[0]), cols
+
+
+def max_path_file(fn, path=False):
+    """max_path() of the triangle stored in 'fn', one row per line"""
+    return max_path(rows_bottom_up(fn), path)